@@ -45,6 +45,13 @@ Your solver must:
         """
 - No printing inside solve().
 - No external libraries (only Python standard library).
+  The in-repo helpers/aocfast.py (stdlib-only) may be used for bulk parsing:
+  just `import aocfast`, e.g. aocfast.tuples(aocfast.to_bytes(lines), 3).
+  This works under run_day.py and when running the solver file directly
+  (python/aocfast.py forwards to helpers/); do not touch sys.path in solvers.
+- Keep slow-to-import stdlib modules as deferred imports, e.g.
+  decimal = aocfast.lazy_import("decimal"), so loading the solver file stays
+  cheap until solve() actually uses them.
 - Runtime should be efficient (O(N) or close).
 
 Deliverable:
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+aocfast.py — Bulk input parsers for AoC 2025 solvers.
+Parsers take the whole input as bytes instead of looping over lines with
+strip()/split()/int(), so every solver shares one validated implementation.
+Not every parser is faster than that loop: ints()/uints() are convenience
+extractors (about break-even); grid(), tuples(), moves() and sections() are
+the ones that measure faster (see --bench).
+
+Functions:
+- ints(buf)            all signed integers, e.g. b"L68 R-3" -> [68, -3]
+- uints(buf)           all unsigned integers ('-' is a separator, e.g. ranges "11-22")
+- tuples(buf, arity)   flat array('q') of fixed-arity comma tuples ("x,y,z" per line)
+- moves(buf)           direction-prefixed steps ("L68", "R14") -> signed ints
+- grid(buf)            rectangular character grid -> (bytearray, width, height)
+- sections(buf)        blank-line-separated sections -> list[bytes]
+- lazy_import(name)    module proxy that only really imports on first attribute use
+
+Solvers still receive lines: list[str] from run_day.py; use to_bytes(lines)
+to get a buffer.
+
+Run with --bench to compare aocfast(to_bytes(lines)) against an idiomatic
+per-line comprehension on inputs/; without flags it runs the self-checks.
+"""
+
+import importlib.util
+import json
+import re
+import sys
+from array import array
+from itertools import chain
+from types import ModuleType
+from typing import List, Tuple, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+_INT_RE = re.compile(rb"-?\d+")
+_UINT_RE = re.compile(rb"\d+")
+_BLANK_LINES_RE = re.compile(rb"(?:\n[ \t]*)+\n")
+# The only bytes tuples() accepts; everything else is rejected before parsing.
+_TUPLE_CHARS = b"0123456789-, \t\r\n"
+
+
+def to_bytes(lines: List[str]) -> bytes:
+    """Join dispatcher lines back into a single bytes buffer."""
+    return "\n".join(lines).encode("ascii")
+
+
+def ints(buf: Buffer) -> List[int]:
+    """Return every signed integer in buf, in order."""
+    return list(map(int, _INT_RE.findall(buf)))
+
+
+def uints(buf: Buffer) -> List[int]:
+    """Return every unsigned integer in buf, in order ('-' is treated as a separator)."""
+    return list(map(int, _UINT_RE.findall(buf)))
+
+
+def tuples(buf: Buffer, arity: int) -> array:
+    """
+    Parse fixed-arity comma tuples ("x,y,z" per line) into a flat array('q').
+    Row i occupies [i*arity, (i+1)*arity). Blank lines are skipped, and spaces
+    or tabs around fields are ignored, as int() would.
+    Raises ValueError on any other byte, a malformed or empty field, a ragged row,
+    or a value outside the int64 range of array('q').
+    """
+    if arity < 1:
+        raise ValueError("arity must be >= 1")
+    data = bytes(buf)
+    bad = data.translate(None, _TUPLE_CHARS)
+    if bad:
+        raise ValueError(f"unexpected byte {bad[:1]!r} in tuple input")
+    try:
+        # One json.loads() call parses every row in C; int() per field is the slow part of the naive loop.
+        rows = json.loads(b"[[" + data.replace(b"\n", b"],[") + b"]]")
+    except ValueError:
+        # json rejects leading zeros ("007") that int() accepts; redo those inputs field by field.
+        try:
+            rows = [[int(x) for x in line.split(b",")] for line in data.split(b"\n") if line.strip()]
+        except ValueError:
+            raise ValueError("malformed integer in tuple input") from None
+    widths = set(map(len, rows))
+    widths.discard(0)  # blank lines
+    if widths - {arity}:
+        row = next(r for r in rows if r and len(r) != arity)
+        raise ValueError(f"row {row!r} does not have {arity} fields")
+    out = array("q")
+    try:
+        out.fromlist(list(chain.from_iterable(rows)))
+    except OverflowError:
+        raise ValueError("value out of int64 range in tuple input") from None
+    return out
+
+
+def moves(buf: Buffer, neg: bytes = b"L", pos: bytes = b"R") -> List[int]:
+    """
+    Parse direction-prefixed steps (e.g. "L68", "R14") into signed ints:
+    `neg` steps become negative, `pos` steps positive.
+    Raises ValueError unless every whitespace-separated token is <neg|pos><digits>.
+    """
+    data = bytes(buf)
+    bad = data.translate(None, neg + pos + b"0123456789 \t\r\n")
+    if bad:
+        raise ValueError(f"unexpected byte {bad[:1]!r} in move input")
+    tokens = data.translate(bytes.maketrans(neg + pos, b"-+")).split()
+    # int() rejects a sign anywhere but the front, so one sign per token means every token had a prefix.
+    if data.count(neg) + data.count(pos) != len(tokens):
+        raise ValueError("every move needs exactly one direction prefix")
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        raise ValueError("malformed move in input") from None
+
+
+def grid(buf: Buffer) -> Tuple[bytearray, int, int]:
+    """
+    Parse a rectangular grid into a flat bytearray (row-major, no newlines).
+    Cell (r, c) is data[r * width + c]. An empty buffer gives (bytearray(), 0, 0).
+    Raises ValueError if rows differ in width.
+    """
+    data = bytes(buf).replace(b"\r", b"").strip(b"\n")
+    if not data:
+        return bytearray(), 0, 0
+    rows = data.split(b"\n")
+    width = len(rows[0])
+    if any(len(row) != width for row in rows):
+        raise ValueError("grid rows are not all the same width")
+    return bytearray(b"".join(rows)), width, len(rows)
+
+
+def sections(buf: Buffer) -> List[bytes]:
+    """
+    Split buf on blank (empty or whitespace-only) lines.
+    Each section is stripped of surrounding whitespace; empty sections are dropped.
+    """
+    data = bytes(buf)
+    if b"\r" in data:
+        data = data.replace(b"\r", b"")
+    # Single-byte membership tests are memchr scans; only inputs that contain
+    # spaces or tabs can have whitespace-only lines and need the regex.
+    if b" " in data or b"\t" in data:
+        blocks = _BLANK_LINES_RE.split(data)
+    else:
+        blocks = data.split(b"\n\n")
+    return [b for b in (block.strip() for block in blocks) if b]
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Return module `name`, deferring its real import until an attribute is used.
+    Lets a solver keep a slow-to-import module at top level without paying
+    for it when the dispatcher only loads the file.
+    Raises ModuleNotFoundError immediately if the module is not installed.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# ---------------------------------------------------------------------------
+# Benchmark: python helpers/aocfast.py --bench
+# ---------------------------------------------------------------------------
+
+def _naive_tuples(lines: List[str]) -> List[Tuple[int, ...]]:
+    return [tuple(map(int, line.split(","))) for line in lines if line]
+
+
+def _naive_ranges(lines: List[str]) -> List[int]:
+    return [int(x) for part in lines[0].split(",") for x in part.split("-")]
+
+
+def _naive_moves(lines: List[str]) -> List[int]:
+    return [-int(line[1:]) if line[0] == "L" else int(line[1:]) for line in lines if line]
+
+
+def _naive_grid(lines: List[str]) -> List[List[str]]:
+    return [list(line) for line in lines if line]
+
+
+def _naive_sections(lines: List[str]) -> List[List[str]]:
+    out, cur = [], []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            if cur:
+                out.append(cur)
+            cur = []
+        else:
+            cur.append(line)
+    if cur:
+        out.append(cur)
+    return out
+
+
+def _bench(repeat: int) -> None:
+    import timeit
+    from pathlib import Path
+
+    inputs = Path(__file__).resolve().parents[1] / "inputs"
+    cases = [
+        ("day01 moves", "day01.txt", _naive_moves, moves),
+        ("day02 ranges", "day02.txt", _naive_ranges, uints),
+        ("day04 grid", "day04.txt", _naive_grid, grid),
+        ("day05 sections", "day05.txt", _naive_sections, sections),
+        ("day08 tuples", "day08.txt", _naive_tuples, lambda b: tuples(b, 3)),
+        ("day09 tuples", "day09.txt", _naive_tuples, lambda b: tuples(b, 2)),
+    ]
+    print(f"{'case':<16} {'naive ms':>10} {'aocfast ms':>11} {'speedup':>8}")
+    for name, fname, naive, fast in cases:
+        path = inputs / fname
+        if not path.exists():
+            print(f"{name:<16} (missing {fname})")
+            continue
+        # Same starting point as a solver: the dispatcher's lines; the fast side pays for to_bytes().
+        lines = path.read_text(encoding="utf-8").splitlines()
+        t_naive = min(timeit.repeat(lambda: naive(lines), number=1, repeat=repeat))
+        t_fast = min(timeit.repeat(lambda: fast(to_bytes(lines)), number=1, repeat=repeat))
+        print(f"{name:<16} {t_naive * 1e3:>10.3f} {t_fast * 1e3:>11.3f} {t_naive / t_fast:>7.1f}x")
+
+
+def _expect(actual, expected) -> None:
+    if actual != expected:
+        raise AssertionError(f"expected {expected!r}, got {actual!r}")
+
+
+def _expect_error(fn, *args) -> None:
+    try:
+        fn(*args)
+    except ValueError:
+        return
+    raise AssertionError(f"{fn.__name__}{args!r} did not raise ValueError")
+
+
+def _self_test() -> None:
+    # Explicit raises rather than assert, so the checks also run under python -O.
+    _expect(ints(b"L68\nR-3\n"), [68, -3])
+    _expect(uints(b"11-22,95-115"), [11, 22, 95, 115])
+
+    _expect(list(tuples(b"1,2,3\n4,-5,6\n", 3)), [1, 2, 3, 4, -5, 6])
+    _expect(list(tuples(b"1,2\r\n\r\n3,4\r\n", 2)), [1, 2, 3, 4])
+    _expect(list(tuples(b"", 3)), [])
+    _expect_error(tuples, b"1_0,2,3", 3)
+    _expect_error(tuples, b"1,2,3\n4,5\n6", 3)
+    _expect_error(tuples, b"1,2\n3,4,5,6", 3)
+    _expect_error(tuples, b"1,,2\n3,4,5", 3)
+    _expect_error(tuples, b"1-2,3,4", 3)
+    _expect_error(tuples, b"1 2,3,4", 3)
+    _expect_error(tuples, b"99999999999999999999,1", 2)
+    _expect(list(tuples(b"1, 2 \n007,-3\t\n", 2)), [1, 2, 7, -3])
+
+    _expect(moves(b"L68\r\nR14\n\n"), [-68, 14])
+    _expect(moves(b""), [])
+    _expect_error(moves, b"L68\nX3")
+    _expect_error(moves, b"R")
+    _expect_error(moves, b"68")
+    _expect_error(moves, b"L6R8")
+
+    _expect(grid(b"ab\ncd\n"), (bytearray(b"abcd"), 2, 2))
+    _expect(grid(b"ab\r\ncd\r\n"), (bytearray(b"abcd"), 2, 2))
+    _expect(grid(b""), (bytearray(), 0, 0))
+    _expect_error(grid, b"ab\nc")
+
+    _expect(sections(b"1\n2\n\n3\n"), [b"1\n2", b"3"])
+    _expect(sections(b"a\r\n\r\nb\r\n"), [b"a", b"b"])
+    _expect(sections(b"a\n \n\t\nb"), [b"a", b"b"])
+    _expect(sections(b"a b\n\nc"), [b"a b", b"c"])
+    _expect(sections(b""), [])
+    _expect(sections(b"\n\n\n"), [])
+
+    _expect(lazy_import("fractions").Fraction(1, 2), 0.5)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Bulk AoC input parsers.")
+    ap.add_argument("--bench", action="store_true", help="Benchmark against idiomatic per-line parsing")
+    ap.add_argument("--repeat", type=int, default=20, help="Timing repetitions (best of N)")
+    args = ap.parse_args()
+
+    _self_test()
+    if args.bench:
+        _bench(args.repeat)
+    else:
+        print("Self-checks passed.")
@@ -1,33 +1,15 @@
-
 #!/usr/bin/env python3
+"""
+Stdin wrapper for Day 1, kept for old pipelines (e.g. `python misc/solve_day1.py < input.txt`).
+The solver itself lives in python/day01-code.py; this file no longer duplicates it.
+"""
+import os
 import sys
 
-def solve(lines):
-    pos = 50  # starting position per puzzle
-    part1 = 0
-    part2 = 0
-
-    for ln in lines:
-        ln = ln.strip()
-        if not ln: 
-            continue
-        dirc, val = ln[0].upper(), int(ln[1:])
-        m = val if dirc == 'R' else -val
-
-        # Part 2: count zero passes/landings during the move
-        if m >= 0:
-            part2 += (pos + m) // 100
-        else:
-            part2 += ((pos - 1) // 100) - ((pos + m - 1) // 100)
-
-        # Update position with wrap-around (Python's % already non-negative)
-        pos = (pos + m) % 100
-
-        # Part 1: count moves that end on zero
-        if pos == 0:
-            part1 += 1
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from run_day import load_solver_module  # noqa: E402
 
-    return part1, part2
+solve = load_solver_module(1).solve
 
 if __name__ == "__main__":
     lines = sys.stdin.read().splitlines()
@@ -0,0 +1,16 @@
+"""
+Forwarder so solvers run directly (python python/dayXX-code.py) can `import aocfast`.
+Python puts python/ on sys.path for such runs; this loads helpers/aocfast.py under
+the same name. Under run_day.py helpers/ comes first on sys.path, so this file is
+never imported there.
+"""
+import importlib.util
+import os
+import sys
+
+_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "helpers", "aocfast.py")
+_spec = importlib.util.spec_from_file_location(__name__, os.path.normpath(_path))
+_mod = importlib.util.module_from_spec(_spec)
+# The import system returns sys.modules[__name__] once this file finishes, i.e. the real module.
+sys.modules[__name__] = _mod
+_spec.loader.exec_module(_mod)
@@ -9,6 +9,8 @@ Contract:
 
 from typing import List, Tuple
 
+import aocfast
+
 
 def solve(lines: List[str]) -> Tuple[int, int]:
     """
@@ -29,16 +31,12 @@ def solve(lines: List[str]) -> Tuple[int, int]:
     part1 = 0
     part2 = 0
 
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        direction = line[0]
-        steps = int(line[1:])
+    for move in aocfast.moves(aocfast.to_bytes(lines)):
+        steps = abs(move)
 
         # For Part 2, count intermediate zeros
         # Compute how many times we cross 0 during this rotation
-        if direction == "L":
+        if move < 0:
             # Moving left: decreasing position
             # Each full cycle of 100 steps crosses 0 once
             full_cycles = steps // MOD
@@ -49,7 +47,7 @@ def solve(lines: List[str]) -> Tuple[int, int]:
             if pos - rem < 0:
                 part2 += 1
             pos = (pos - steps) % MOD
-        else:  # direction == "R"
+        else:  # moving right
             full_cycles = steps // MOD
             part2 += full_cycles
             rem = steps % MOD
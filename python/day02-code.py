@@ -1,12 +1,17 @@
 
-from typing import List, Tupledef solve(lines: List[str]) -> Tuple[int, int]:
+from typing import List, Tuple
+
+import aocfast
+
+
+def solve(lines: List[str]) -> Tuple[int, int]:
     """
     Advent of Code 2025 - Day 2: Gift Shop
     Part 1: Sum of invalid IDs (pattern: repeated sequence twice) in given ranges.
     Part 2: (Assuming same logic unless puzzle specifies otherwise; placeholder for extension.)
     """
-    # Parse input: single line with comma-separated ranges
-    ranges = lines[0].strip().split(',')
+    # Parse input: single line with comma-separated ranges "start-end"
+    bounds = aocfast.uints(aocfast.to_bytes(lines))
     
     def is_invalid(n: int) -> bool:
         s = str(n)
@@ -17,8 +22,7 @@ from typing import List, Tupledef solve(lines: List[str]) -> Tuple[int, int]:
         return s[:half] == s[half:]
     
     part1_sum = 0
-    for r in ranges:
-        start, end = map(int, r.split('-'))
+    for start, end in zip(bounds[::2], bounds[1::2]):
         for num in range(start, end + 1):
             if is_invalid(num):
                 part1_sum += num
@@ -2,48 +2,277 @@
 """
 AoC 2025 dispatcher for Python solvers.
 Loads python/dayXX-code.py, reads inputs/dayXX.txt, and prints Part 1 & Part 2.
+With --watch, polls python/ and inputs/ and re-runs only the day whose solver
+or input changed, printing the new answers and the timing delta.
+
+Startup is kept import-light: only the requested day's solver is loaded, and
+watch-mode machinery (multiprocessing, tracebacks) is imported on demand.
+Paths use os.path rather than pathlib for the same reason. (re is not
+deferred: argparse already imports it.)
+Check with: python -X importtime run_day.py --day 1
 """
 
+from __future__ import annotations
+
 import argparse
 import importlib.util
-from pathlib import Path
-from typing import Tuple, List
+import os
+import re
+import sys
+import time
+from importlib.machinery import SourceFileLoader
+from types import ModuleType
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PYCODE_DIR = os.path.join(ROOT, "python")
+INPUTS_DIR = os.path.join(ROOT, "inputs")
+HELPERS_DIR = os.path.join(ROOT, "helpers")
+
+# Let solvers `import aocfast` (stdlib-only bulk parsers in helpers/).
+if HELPERS_DIR not in sys.path:
+    sys.path.insert(0, HELPERS_DIR)
 
-ROOT = Path(__file__).resolve().parent
-PYCODE_DIR = ROOT / "python"
-INPUTS_DIR = ROOT / "inputs"
+# python/dayXX-code.py or inputs/dayXX.txt -> day XX
+WATCH_PATTERNS = {
+    PYCODE_DIR: re.compile(r"^day(\d{2})-code\.py$"),
+    INPUTS_DIR: re.compile(r"^day(\d{2})\.txt$"),
+}
 
-def load_solver_module(day: int):
-    code_path = PYCODE_DIR / f"day{day:02d}-code.py"
-    if not code_path.exists():
+def solver_path(day: int) -> str:
+    return os.path.join(PYCODE_DIR, f"day{day:02d}-code.py")
+
+def input_path(day: int) -> str:
+    return os.path.join(INPUTS_DIR, f"day{day:02d}.txt")
+
+def available_days() -> list[int]:
+    """Days that have a solver file, found by name only (nothing is imported)."""
+    days = []
+    for name in os.listdir(PYCODE_DIR):
+        if name.startswith("day") and name.endswith("-code.py") and name[3:5].isdigit():
+            days.append(int(name[3:5]))
+    return sorted(days)
+
+def load_solver_module(day: int, fresh: bool = False) -> ModuleType:
+    """
+    Load the solver module for one day (only that day's file is touched).
+    By default SourceFileLoader.get_code reads/writes the mtime-keyed
+    python/__pycache__/dayXX-code.*.pyc. fresh=True compiles from source
+    instead; watch mode uses it because a same-size edit within the same
+    second would still match the old .pyc.
+    """
+    code_path = solver_path(day)
+    if not os.path.exists(code_path):
         raise FileNotFoundError(f"Python solver not found: {code_path}")
-    spec = importlib.util.spec_from_file_location(f"day{day:02d}_code", code_path)
-    mod = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(mod)
+
+    name = f"day{day:02d}_code"
+    loader = SourceFileLoader(name, code_path)
+    if not fresh:
+        code = loader.get_code(name)
+    else:
+        code = compile(loader.get_data(code_path), code_path, "exec")
+    # module_from_spec fills in __spec__, __file__, __cached__ and __loader__.
+    mod = importlib.util.module_from_spec(importlib.util.spec_from_loader(name, loader))
+    exec(code, mod.__dict__)
     if not hasattr(mod, "solve"):
         raise AttributeError(f"{code_path} must define a function solve(lines: List[str]) -> Tuple[int,int]")
     return mod
 
-def read_input(day: int) -> List[str]:
-    in_path = INPUTS_DIR / f"day{day:02d}.txt"
-    if not in_path.exists():
+def compile_solvers() -> None:
+    """Precompile every python/dayXX-code.py into __pycache__ (timestamp-validated .pyc)."""
+    import py_compile
+
+    for day in available_days():
+        path = solver_path(day)
+        try:
+            py_compile.compile(path, doraise=True)
+            print(f"Compiled {os.path.relpath(path, ROOT)}")
+        except py_compile.PyCompileError as e:
+            print(f"Failed   {os.path.relpath(path, ROOT)}: {e.msg.strip().splitlines()[-1]}")
+
+def read_input(day: int) -> list[str]:
+    in_path = input_path(day)
+    if not os.path.exists(in_path):
         raise FileNotFoundError(f"Input not found: {in_path}")
-    return in_path.read_text(encoding="utf-8").splitlines()
+    with open(in_path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+def check_result(res) -> tuple[int, int]:
+    if (not isinstance(res, tuple)) or len(res) != 2:
+        raise TypeError("solve(lines) must return a tuple (part1:int, part2:int)")
+    return res
+
+def run_solver(day: int) -> tuple[int, int]:
+    lines = read_input(day)
+    mod = load_solver_module(day)
+    return check_result(mod.solve(lines))
+
+def scan_days(only_day: int | None = None) -> dict[str, tuple[int, int]]:
+    """Map each watched file to (day, mtime_ns)."""
+    found = {}
+    for folder, pattern in WATCH_PATTERNS.items():
+        if not os.path.isdir(folder):
+            continue
+        for entry in os.scandir(folder):
+            m = pattern.match(entry.name)
+            if not m:
+                continue
+            day = int(m.group(1))
+            if only_day is not None and day != only_day:
+                continue
+            try:
+                found[entry.path] = (day, entry.stat().st_mtime_ns)
+            except FileNotFoundError:
+                continue  # removed between scandir() and stat()
+    return found
+
+def timed_run(day: int, conn) -> None:
+    """
+    Watch-mode child process: run one day and send back
+    (result, load seconds, solve seconds, error) over conn.
+    Only mod.solve(lines) is inside the solve timing.
+    """
+    load_s = solve_s = 0.0
+    try:
+        start = time.perf_counter()
+        lines = read_input(day)
+        mod = load_solver_module(day, fresh=True)
+        load_s = time.perf_counter() - start
+        start = time.perf_counter()
+        res = mod.solve(lines)
+        solve_s = time.perf_counter() - start
+        conn.send((check_result(res), load_s, solve_s, None))
+    except KeyboardInterrupt:
+        pass  # the parent is shutting down and will terminate us
+    except Exception:
+        import traceback
+
+        conn.send((None, load_s, solve_s, traceback.format_exc()))
+    finally:
+        conn.close()
+
+def watch(only_day: int | None, interval: float, jobs: int, slow_after: float = 5.0) -> None:
+    """
+    Poll solver/input mtimes and re-run affected days; Ctrl+C to stop.
+    Each run gets its own process, so a solver stuck in an endless loop is
+    terminated when its files change again (or on Ctrl+C) instead of blocking
+    the watcher. At most `jobs` runs share the CPU at once, so the startup
+    sweep over every day does not skew the timings it reports.
+    """
+    import multiprocessing
+
+    cache: dict[int, tuple[tuple[int, int], float]] = {}  # day -> (answers, solve seconds)
+    running = {}  # day -> (process, parent end of pipe, start time, warned)
+    queue: list[int] = []  # days waiting for a free slot, in order
+    seen = scan_days(only_day)
+    dirty = {day for day, _ in seen.values()}
+    next_scan = time.perf_counter() + interval
+
+    def stamp() -> str:
+        return time.strftime("%H:%M:%S")
+
+    def report(day, res, load_s, solve_s, err):
+        if err is not None:
+            print(f"[{stamp()}] Day {day:02d} failed:\n{err}", flush=True)
+            return
+        prev = cache.get(day)
+        delta = ""
+        if prev is not None:
+            delta = f" ({(solve_s - prev[1]) * 1e3:+.1f} ms vs previous"
+            delta += ", answers unchanged)" if prev[0] == res else ", answers changed)"
+        cache[day] = (res, solve_s)
+        print(f"[{stamp()}] Day {day:02d}: Part 1: {res[0]}  Part 2: {res[1]}  "
+              f"solve {solve_s * 1e3:.1f} ms (load {load_s * 1e3:.1f} ms){delta}", flush=True)
+
+    def start(day):
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        proc = multiprocessing.Process(target=timed_run, args=(day, child_conn), daemon=True)
+        proc.start()
+        child_conn.close()
+        running[day] = (proc, parent_conn, time.perf_counter(), False)
+
+    def stop(day):
+        proc, conn, _, _ = running.pop(day)
+        proc.terminate()
+        proc.join()
+        conn.close()
+
+    scope = f"day {only_day:02d}" if only_day is not None else "all days"
+    print(f"Watching python/ and inputs/ for {scope} (Ctrl+C to stop)...", flush=True)
+    try:
+        while True:
+            for day in sorted(dirty):
+                if day in running:
+                    elapsed = time.perf_counter() - running[day][2]
+                    print(f"[{stamp()}] Day {day:02d} changed while running ({elapsed:.1f} s); restarting.", flush=True)
+                    stop(day)
+                # Only days with both a solver and an input can run.
+                if day not in queue and os.path.exists(solver_path(day)) and os.path.exists(input_path(day)):
+                    queue.append(day)
+            dirty.clear()
+
+            for day, (proc, conn, started, warned) in list(running.items()):
+                if conn.poll():
+                    try:
+                        msg = conn.recv()
+                    except EOFError:
+                        msg = None
+                    stop(day)
+                    if msg is not None:
+                        report(day, *msg)
+                    else:
+                        print(f"[{stamp()}] Day {day:02d} exited without a result.", flush=True)
+                elif not proc.is_alive():
+                    stop(day)
+                    print(f"[{stamp()}] Day {day:02d} died with exit code {proc.exitcode}.", flush=True)
+                elif not warned and time.perf_counter() - started > slow_after:
+                    print(f"[{stamp()}] Day {day:02d} still running after {slow_after:.0f} s; "
+                          f"save a change to restart it.", flush=True)
+                    running[day] = (proc, conn, started, True)
+
+            # A run flagged as slow no longer holds a slot, so one stuck solver
+            # cannot stall every other day (their timings then share the CPU with it).
+            active = sum(1 for entry in running.values() if not entry[3])
+            while queue and active < jobs:
+                start(queue.pop(0))
+                active += 1
+
+            # Tick quickly while work is in flight; rescan files every `interval`.
+            time.sleep(0.01 if running or queue else interval)
+            if time.perf_counter() >= next_scan:
+                current = scan_days(only_day)
+                for path, (day, mtime) in current.items():
+                    if seen.get(path) != (day, mtime):
+                        dirty.add(day)
+                seen = current
+                next_scan = time.perf_counter() + interval
+    except KeyboardInterrupt:
+        for day in sorted(running):
+            print(f"Day {day:02d} was still running; terminated.")
+            stop(day)
+        print("Stopped watching.")
 
 def main():
     ap = argparse.ArgumentParser(description="Run AoC 2025 Python solution for a given day.")
-    ap.add_argument("--day", type=int, required=True, help="Day number (1–25)")
+    ap.add_argument("--day", type=int, help="Day number (1–25); optional with --watch")
+    ap.add_argument("--watch", action="store_true", help="Re-run on changes to python/dayXX-code.py or inputs/dayXX.txt")
+    ap.add_argument("--interval", type=float, default=0.25, help="Polling interval in seconds for --watch")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                    help="Max concurrent solver runs for --watch (default: CPU count)")
+    ap.add_argument("--compile", action="store_true", help="Precompile all solvers to cached bytecode and exit")
     args = ap.parse_args()
-    if not (1 <= args.day <= 25):
+    if args.compile:
+        compile_solvers()
+        return
+    if args.day is None and not args.watch:
+        ap.error("--day is required unless --watch or --compile is given")
+    if args.day is not None and not (1 <= args.day <= 25):
         raise ValueError("Day must be between 1 and 25.")
 
-    lines = read_input(args.day)
-    mod = load_solver_module(args.day)
-    res = mod.solve(lines)
-    if (not isinstance(res, tuple)) or len(res) != 2:
-        raise TypeError("solve(lines) must return a tuple (part1:int, part2:int)")
-    part1, part2 = res
+    if args.watch:
+        watch(args.day, args.interval, max(1, args.jobs))
+        return
+
+    part1, part2 = run_solver(args.day)
     print(f"Part 1: {part1}")
     print(f"Part 2: {part2}")
 